@@ -1,4 +1,4 @@
-import { Human } from './human.js';
+import { Human, clamp, CATEGORIES, RESERVE_NTS } from './human.js';
 
 // Module-level flag for probabilistic outcomes (tests can toggle off)
 export let ENABLE_PROBABILISTIC = true;
@@ -11,6 +11,14 @@ export function getEnableProbabilistic() {
   return ENABLE_PROBABILISTIC;
 }
 
+// Source of uniform [0, 1) draws for probabilistic outcomes. Tests can inject a
+// fixed or seeded function; pass null to restore Math.random.
+let _random = Math.random;
+
+export function setRandom(fn) {
+  _random = fn ?? Math.random;
+}
+
 // Pending notifications for UI — cleared each frame by drainNotifications()
 let _pendingNotifications = [];
 
@@ -24,8 +32,9 @@ export function drainNotifications() {
 // BASELINE DECAY - Homeostasis
 // =============================================================================
 
-// Each parameter decays toward its baseline at a certain rate per hour
-export const BASELINES = {
+// Each parameter decays toward its baseline at a certain rate per hour.
+// Frozen: get_effective_baselines memoizes results derived from it.
+export const BASELINES = Object.freeze({
   dopamine: 50.0,
   oxytocin: 30.0,       // passive bonding, relaxation, diffuse pleasure
   endorphins: 20.0,
@@ -39,7 +48,7 @@ export const BASELINES = {
   hunger: 50.0,         // hunger increases over time (baseline is "somewhat hungry")
   energy: 50.0,
   anxiety: 30.0,        // moderate baseline anxiety (correlates with cortisol)
-};
+});
 
 // Decay rate: fraction of distance to baseline recovered per hour
 export const DECAY_RATES = {
@@ -88,9 +97,15 @@ export const TOLERANCE_DECAY_RATES = {
 
 // Reserve constants
 export const RESERVE_REPLENISH_RATE = 5.0;    // per hour, for each NT
+export const RESERVE_MIN_SCALE = 0.15;        // boost scale when reserves are empty
+export const RESERVE_COST_PER_POINT = 0.5;    // reserve consumed per point of raw boost
 export const SLEEP_RESERVE_RESTORE = 40.0;    // how much reserves restore on sleep
 export const SLEEP_TOLERANCE_REDUCE = 0.15;   // how much tolerance drops on sleep
 
+// Cue salience constants
+export const CUE_SALIENCE_DECAY_RATE = 0.02;  // per hour (sensitization persists)
+export const SLEEP_CUE_SALIENCE_REDUCE = 0.05; // how much cue salience drops on sleep
+
 // Sustained delivery constants
 export const SUSTAINED_FRACTION = 0.4;        // 40% of boost delivered over time
 export const SUSTAINED_DURATION = 0.25;       // hours
@@ -103,18 +118,36 @@ export const ORGASM_IMMEDIATE_FRACTION = 0.9; // orgasm is 90% immediate, 10% su
 export const OPPONENT_PROCESS_THRESHOLD = 10;
 export const OPPONENT_PROCESS_RATIO = 0.3;
 export const OPPONENT_PROCESS_DELAY = 0.5;
+export const OPPONENT_PROCESS_DURATION = 1.0;
 
 // =============================================================================
 // EFFECTIVE BASELINES (trait-modified)
 // =============================================================================
 
+// Max number of distinct trait combinations kept; oldest entries are evicted first
+const BASELINES_CACHE_SIZE = 1024;
+
+// Keyed on the trait triple; Map insertion order gives LRU eviction
+const _baselinesCache = new Map();
+
 /**
- * Return a per-human copy of BASELINES modified by traits (testosterone,
- * SSRI, life stress). Never mutates the shared BASELINES dict.
- * All values clamped to [0, 100].
+ * Return BASELINES modified by traits (testosterone, SSRI, life stress).
+ * Never mutates the shared BASELINES dict. All values clamped to [0, 100].
+ *
+ * The result depends only on the three traits, which change rarely, so it is
+ * memoized per trait combination and returned frozen: callers must not mutate it.
  */
 export function get_effective_baselines(human) {
-  const eb = { ...BASELINES };
+  const key = human.testosterone + '|' + human.ssri_level + '|' + human.life_stress;
+  let eb = _baselinesCache.get(key);
+  if (eb) {
+    // Refresh LRU position
+    _baselinesCache.delete(key);
+    _baselinesCache.set(key, eb);
+    return eb;
+  }
+
+  eb = { ...BASELINES };
   const t_factor = human.testosterone / 50.0 - 1.0;  // -1 at T=0, 0 at T=50, +1 at T=100
   const ssri_pct = human.ssri_level / 100.0;
   const stress_pct = human.life_stress / 100.0;
@@ -136,9 +169,14 @@ export function get_effective_baselines(human) {
 
   // Clamp all to [0, 100]
   for (const k of Object.keys(eb)) {
-    eb[k] = Math.max(0.0, Math.min(100.0, eb[k]));
+    eb[k] = clamp(eb[k], 0.0, 100.0);
   }
 
+  if (_baselinesCache.size >= BASELINES_CACHE_SIZE) {
+    _baselinesCache.delete(_baselinesCache.keys().next().value);
+  }
+  Object.freeze(eb);
+  _baselinesCache.set(key, eb);
   return eb;
 }
 
@@ -147,8 +185,8 @@ export function get_effective_baselines(human) {
 // =============================================================================
 
 function gaussRandom(mu, sigma) {
-  const u = 1 - Math.random();
-  const v = Math.random();
+  const u = 1 - _random();
+  const v = _random();
   const z = Math.sqrt(-2.0 * Math.log(u)) * Math.cos(2.0 * Math.PI * v);
   return mu + z * sigma;
 }
@@ -164,17 +202,18 @@ function gaussRandom(mu, sigma) {
 export function nt_boost(human, attr, raw_amount, is_orgasm = false) {
   if (raw_amount <= 0) return;
 
-  // Map NT attr to reserve key
-  const reserve_key = attr;  // dopamine, serotonin, endorphins, oxytocin
-  if (!(reserve_key in human.reserves)) {
+  // NT attr doubles as the reserve key (dopamine, serotonin, endorphins, oxytocin).
+  // One keyed load replaces the separate `in` check + read.
+  const reserves = human.reserves;
+  const reserve_level = reserves[attr];
+  if (reserve_level === undefined) {
     // Not a tracked NT, apply directly
     human[attr] += raw_amount;
     return;
   }
 
   // Scale by reserve level: 15% minimum at 0, 100% at 100
-  const reserve_level = human.reserves[reserve_key];
-  const scale_factor = 0.15 + 0.85 * (reserve_level / 100.0);
+  const scale_factor = RESERVE_MIN_SCALE + (1.0 - RESERVE_MIN_SCALE) * (reserve_level / 100.0);
   let scaled_amount = raw_amount * scale_factor;
 
   // SSRI dopamine capping: at max SSRI, dopamine boosts are 60% of normal
@@ -184,7 +223,7 @@ export function nt_boost(human, attr, raw_amount, is_orgasm = false) {
   }
 
   // Consume reserves (0.5 per point of boost), clamp to 0
-  human.reserves[reserve_key] = Math.max(0, human.reserves[reserve_key] - raw_amount * 0.5);
+  reserves[attr] = Math.max(0, reserve_level - raw_amount * RESERVE_COST_PER_POINT);
 
   // Split immediate vs sustained
   const immediate_frac = is_orgasm ? ORGASM_IMMEDIATE_FRACTION : (1.0 - SUSTAINED_FRACTION);
@@ -206,13 +245,14 @@ export function nt_boost(human, attr, raw_amount, is_orgasm = false) {
   }
 
   // Opponent-process rebound: large boosts schedule a delayed negative rebound
-  if (raw_amount > 10 && reserve_key in human.reserves) {
-    const rebound_amount = scaled_amount * 0.3;
+  // (only tracked NTs reach this point, so no second reserve check is needed)
+  if (raw_amount > OPPONENT_PROCESS_THRESHOLD) {
+    const rebound_amount = scaled_amount * OPPONENT_PROCESS_RATIO;
     human.rebound_queue.push({
       attr,
       amount: -rebound_amount,
-      delay_remaining: 0.5,
-      duration: 1.0,
+      delay_remaining: OPPONENT_PROCESS_DELAY,
+      duration: OPPONENT_PROCESS_DURATION,
     });
   }
 }
@@ -419,6 +459,10 @@ export function apply_event(human, event_name, event) {
 // DECAY
 // =============================================================================
 
+// Attributes that decay toward a baseline, resolved once so apply_decay()
+// walks a fixed array instead of Object.entries() + an `in` test per step
+const DECAY_ATTRS = Object.freeze(Object.keys(BASELINES).filter((k) => k in DECAY_RATES));
+
 /**
  * Apply homeostatic decay - values drift toward baseline.
  * dt is time in hours.
@@ -426,25 +470,22 @@ export function apply_event(human, event_name, event) {
 export function apply_decay(human, dt) {
   // === HOMEOSTATIC DECAY with reserve-depressed baselines ===
   const effective_baselines = get_effective_baselines(human);
-  for (const [attr, baseline] of Object.entries(effective_baselines)) {
-    if (attr in DECAY_RATES) {
-      const current = human[attr];
-      const rate = DECAY_RATES[attr];
-
-      // If this is a tracked NT reserve, depress baseline when reserves are low
-      let effective_baseline = baseline;
-      if (attr in human.reserves) {
-        const reserve = human.reserves[attr];
-        if (reserve < 100) {
-          // At reserve=0, baseline drops to 60% of normal
-          effective_baseline = baseline * (1.0 - (1.0 - reserve / 100.0) * 0.4);
-        }
-      }
-
-      // Exponential decay toward (possibly depressed) baseline
-      const new_value = current + (effective_baseline - current) * rate * dt;
-      human[attr] = new_value;
+  const reserves = human.reserves;
+  for (const attr of DECAY_ATTRS) {
+    const current = human[attr];
+    const baseline = effective_baselines[attr];
+    const rate = DECAY_RATES[attr];
+
+    // If this is a tracked NT reserve, depress baseline when reserves are low
+    let effective_baseline = baseline;
+    const reserve = reserves[attr];
+    if (reserve !== undefined && reserve < 100) {
+      // At reserve=0, baseline drops to 60% of normal
+      effective_baseline = baseline * (1.0 - (1.0 - reserve / 100.0) * 0.4);
     }
+
+    // Exponential decay toward (possibly depressed) baseline
+    human[attr] = current + (effective_baseline - current) * rate * dt;
   }
 
   // Hunger increases over time (not decay, but drift)
@@ -494,53 +535,56 @@ export function apply_decay(human, dt) {
   human.edging_buildup *= (1 - 0.05 * dt);
 
   // === A. Process active_effects (sustained delivery) ===
-  const remaining_effects = [];
-  for (const effect of human.active_effects) {
+  // Every entry is touched each step, so the queues are compacted in place
+  // (keep-index write-back) rather than copied into a fresh array.
+  const effects = human.active_effects;
+  let n_effects = 0;
+  for (let i = 0; i < effects.length; i++) {
+    const effect = effects[i];
     const delivery = effect.rate * dt;
     human[effect.attr] += delivery;
     effect.remaining_hours -= dt;
     if (effect.remaining_hours > 0) {
-      remaining_effects.push(effect);
+      effects[n_effects++] = effect;
     }
   }
-  human.active_effects = remaining_effects;
+  effects.length = n_effects;
 
   // === A2. Process rebound queue (opponent-process) ===
-  const remaining_rebounds = [];
-  for (const rebound of human.rebound_queue) {
+  const rebounds = human.rebound_queue;
+  let n_rebounds = 0;
+  for (let i = 0; i < rebounds.length; i++) {
+    const rebound = rebounds[i];
     if (rebound.delay_remaining > 0) {
       rebound.delay_remaining -= dt;
-      remaining_rebounds.push(rebound);
+      rebounds[n_rebounds++] = rebound;
     } else {
       const rate = rebound.amount / rebound.duration;
       const delivery = rate * dt;
       human[rebound.attr] += delivery;
       rebound.duration -= dt;
       if (rebound.duration > 0) {
-        remaining_rebounds.push(rebound);
+        rebounds[n_rebounds++] = rebound;
       }
     }
   }
-  human.rebound_queue = remaining_rebounds;
+  rebounds.length = n_rebounds;
 
-  // === B. Tolerance decay ===
-  for (const [category, decay_rate] of Object.entries(TOLERANCE_DECAY_RATES)) {
-    if (decay_rate > 0 && category in human.tolerance) {
-      human.tolerance[category] = Math.max(
-        0.0,
-        human.tolerance[category] - decay_rate * dt
-      );
+  // === B. Tolerance decay + B2. Cue salience decay (one pass per category) ===
+  const tolerance = human.tolerance;
+  const cue_salience = human.cue_salience;
+  const cue_decay = CUE_SALIENCE_DECAY_RATE * dt;  // very slow - sensitization persists
+  for (const category of CATEGORIES) {
+    const decay_rate = TOLERANCE_DECAY_RATES[category];
+    if (decay_rate > 0) {
+      tolerance[category] = Math.max(0.0, tolerance[category] - decay_rate * dt);
     }
-  }
-
-  // === B2. Cue salience decay (very slow - sensitization persists) ===
-  for (const category of Object.keys(human.cue_salience)) {
-    human.cue_salience[category] = Math.max(0.0, human.cue_salience[category] - 0.02 * dt);
+    cue_salience[category] = Math.max(0.0, cue_salience[category] - cue_decay);
   }
 
   // === C. Reserve replenishment ===
-  for (const nt of Object.keys(human.reserves)) {
-    human.reserves[nt] += RESERVE_REPLENISH_RATE * dt;
+  for (const nt of RESERVE_NTS) {
+    reserves[nt] += RESERVE_REPLENISH_RATE * dt;
   }
 
   // Anxiety increases with unmet needs
@@ -763,18 +807,21 @@ export function make_events() {
     h.prolactin = eb['prolactin'];
     h.vasopressin = eb['vasopressin'];
     // Sleep special: restore reserves and reduce tolerance
-    for (const nt of Object.keys(h.reserves)) {
-      h.reserves[nt] += SLEEP_RESERVE_RESTORE;
+    const reserves = h.reserves;
+    for (const nt of RESERVE_NTS) {
+      reserves[nt] += SLEEP_RESERVE_RESTORE;
     }
-    for (const cat of Object.keys(h.tolerance)) {
-      h.tolerance[cat] = Math.max(0.0, h.tolerance[cat] - SLEEP_TOLERANCE_REDUCE);
+    const tolerance = h.tolerance;
+    for (const cat of CATEGORIES) {
+      tolerance[cat] = Math.max(0.0, tolerance[cat] - SLEEP_TOLERANCE_REDUCE);
     }
     // Clear active effects and rebounds
     h.active_effects = [];
     h.rebound_queue = [];
     // Sleep reduces cue salience slightly
-    for (const cat of Object.keys(h.cue_salience)) {
-      h.cue_salience[cat] = Math.max(0.0, h.cue_salience[cat] - 0.05);
+    const cue_salience = h.cue_salience;
+    for (const cat of CATEGORIES) {
+      cue_salience[cat] = Math.max(0.0, cue_salience[cat] - SLEEP_CUE_SALIENCE_REDUCE);
     }
     // Sleep clears performance anxiety and partially resolves dorsal shutdown
     h.sexual_inhibition = 0.0;
@@ -827,7 +874,7 @@ export function make_events() {
     h.absorption += 20 * eff;
     h.vasopressin += 15 * eff;
     // Probabilistic: premature orgasm at high arousal
-    if (ENABLE_PROBABILISTIC && h.arousal > 70 && Math.random() < 0.08) {
+    if (ENABLE_PROBABILISTIC && h.arousal > 70 && _random() < 0.08) {
       orgasm(h, eff);
       _pendingNotifications.push({ text: 'unexpected release', type: 'orgasm' });
     }
@@ -854,7 +901,7 @@ export function make_events() {
     h.absorption += 15 * eff;
     h.vasopressin += 12 * eff;
     // Probabilistic: lose control at very high arousal
-    if (ENABLE_PROBABILISTIC && h.arousal > 80 && Math.random() < 0.12) {
+    if (ENABLE_PROBABILISTIC && h.arousal > 80 && _random() < 0.12) {
       orgasm(h, eff);
       _pendingNotifications.push({ text: "couldn't hold back", type: 'orgasm' });
     }
@@ -1129,7 +1176,7 @@ export function make_events() {
     nt_boost(h, 'endorphins', 20 * eff);
     h.anxiety -= 30 * eff;
     // Probabilistic: overwhelming experience
-    if (ENABLE_PROBABILISTIC && Math.random() < 0.05) {
+    if (ENABLE_PROBABILISTIC && _random() < 0.05) {
       h.anxiety += 30;
       h.physical_health -= 5;
       _pendingNotifications.push({ text: 'too much, too fast', type: 'overwhelm' });
@@ -1175,7 +1222,7 @@ export function make_events() {
     nt_boost(h, 'serotonin', 15 * eff);
     nt_boost(h, 'dopamine', 10 * eff);
     // Probabilistic: bad trip
-    if (ENABLE_PROBABILISTIC && Math.random() < 0.15) {
+    if (ENABLE_PROBABILISTIC && _random() < 0.15) {
       h.anxiety += 40;
       h.absorption = 10;
       h.prefrontal += 20;
@@ -1203,7 +1250,7 @@ export function make_events() {
     nt_boost(h, 'serotonin', 10 * eff);
     nt_boost(h, 'endorphins', 15 * eff);
     // Probabilistic: bad trip
-    if (ENABLE_PROBABILISTIC && Math.random() < 0.10) {
+    if (ENABLE_PROBABILISTIC && _random() < 0.10) {
       h.anxiety += 40;
       h.absorption = 10;
       h.prefrontal += 20;
@@ -1307,7 +1354,7 @@ export function make_events() {
     h.absorption += 10 * eff;
     h.arousal += 10 * eff;
     // Probabilistic: vomiting at high arousal
-    if (ENABLE_PROBABILISTIC && h.arousal > 60 && Math.random() < 0.10) {
+    if (ENABLE_PROBABILISTIC && h.arousal > 60 && _random() < 0.10) {
       h.hunger += 20;
       h.energy -= 10;
       h.digesting = 0;
@@ -1354,7 +1401,7 @@ export function make_events() {
     h.arousal += 20 * eff;
     h.energy += 15;
     // Probabilistic: anxiety spike
-    if (ENABLE_PROBABILISTIC && Math.random() < 0.08) {
+    if (ENABLE_PROBABILISTIC && _random() < 0.08) {
       h.anxiety += 35;
       _pendingNotifications.push({ text: 'heart racing', type: 'anxiety' });
     }
@@ -1394,7 +1441,7 @@ export function make_events() {
     h.ssri_level += 8;
     h.serotonin += 3 * eff;
     h.anxiety += 5;  // early side effect: nausea
-    h.ssri_level = Math.max(0.0, Math.min(100.0, h.ssri_level));
+    h.ssri_level = clamp(h.ssri_level, 0.0, 100.0);
     _pendingNotifications.push({ text: 'serotonin rising — dopamine & sexual response will be blunted', type: 'ssri' });
   }
 
@@ -1411,7 +1458,7 @@ export function make_events() {
     h.ssri_level -= 12;
     h.anxiety += 10;
     h.serotonin -= 5;
-    h.ssri_level = Math.max(0.0, Math.min(100.0, h.ssri_level));
+    h.ssri_level = clamp(h.ssri_level, 0.0, 100.0);
     _pendingNotifications.push({ text: 'withdrawal — serotonin crashes, anxiety spikes', type: 'ssri-stop' });
   }
 
@@ -1430,7 +1477,7 @@ export function make_events() {
     h.energy += 5;
     h.arousal += 5 * eff;
     h.anxiety += 3;  // injection stress
-    h.testosterone = Math.max(0.0, Math.min(100.0, h.testosterone));
+    h.testosterone = clamp(h.testosterone, 0.0, 100.0);
   }
 
   events['testosterone_injection'] = new Event(
@@ -1446,7 +1493,7 @@ export function make_events() {
     h.testosterone -= 10;
     h.anxiety -= 3;
     h.arousal -= 5;
-    h.testosterone = Math.max(0.0, Math.min(100.0, h.testosterone));
+    h.testosterone = clamp(h.testosterone, 0.0, 100.0);
   }
 
   events['anti_androgen'] = new Event(
@@ -1464,7 +1511,7 @@ export function make_events() {
     h.psychological_health += 3;
     h.anxiety -= 10;
     h.prefrontal += 10;
-    h.life_stress = Math.max(0.0, Math.min(100.0, h.life_stress));
+    h.life_stress = clamp(h.life_stress, 0.0, 100.0);
     _pendingNotifications.push({ text: 'prefrontal strengthening — anxiety baseline and life stress easing', type: 'life-good' });
   }
 
@@ -1512,7 +1559,7 @@ export function make_events() {
     h.anxiety += 20;
     h.psychological_health -= 5;
     h.energy -= 10;
-    h.life_stress = Math.max(0.0, Math.min(100.0, h.life_stress));
+    h.life_stress = clamp(h.life_stress, 0.0, 100.0);
     _pendingNotifications.push({ text: 'stress+25 — serotonin & dopamine baselines drop, libido suppressed', type: 'life-bad' });
   }
 
@@ -1530,7 +1577,7 @@ export function make_events() {
     h.life_stress += 30;
     h.anxiety += 25;
     h.psychological_health -= 8;
-    h.life_stress = Math.max(0.0, Math.min(100.0, h.life_stress));
+    h.life_stress = clamp(h.life_stress, 0.0, 100.0);
     _pendingNotifications.push({ text: 'stress+30 — chronic anxiety builds, hedonic capacity blunted', type: 'life-bad' });
   }
 
@@ -1549,7 +1596,7 @@ export function make_events() {
     h.anxiety += 15;
     h.oxytocin -= 15;
     h.psychological_health -= 10;
-    h.life_stress = Math.max(0.0, Math.min(100.0, h.life_stress));
+    h.life_stress = clamp(h.life_stress, 0.0, 100.0);
     _pendingNotifications.push({ text: 'oxytocin crashes — bonding circuits deprived, low mood incoming', type: 'life-bad' });
   }
 
@@ -1567,7 +1614,7 @@ export function make_events() {
     h.anxiety -= 10;
     nt_boost(h, 'dopamine', 10 * eff);
     h.psychological_health += 3;
-    h.life_stress = Math.max(0.0, Math.min(100.0, h.life_stress));
+    h.life_stress = clamp(h.life_stress, 0.0, 100.0);
     _pendingNotifications.push({ text: 'stress−20 — dopamine & serotonin baselines recovering', type: 'life-good' });
   }
 
@@ -1585,7 +1632,7 @@ export function make_events() {
     h.life_stress -= 15;
     h.anxiety -= 8;
     h.psychological_health += 2;
-    h.life_stress = Math.max(0.0, Math.min(100.0, h.life_stress));
+    h.life_stress = clamp(h.life_stress, 0.0, 100.0);
     _pendingNotifications.push({ text: 'stress−15 — chronic anxiety easing, energy floor rising', type: 'life-good' });
   }
 
@@ -1605,7 +1652,7 @@ export function make_events() {
     nt_boost(h, 'dopamine', 15 * eff);
     h.anxiety -= 5;
     h.psychological_health += 5;
-    h.life_stress = Math.max(0.0, Math.min(100.0, h.life_stress));
+    h.life_stress = clamp(h.life_stress, 0.0, 100.0);
     _pendingNotifications.push({ text: 'oxytocin & dopamine surge — bonding circuits activated', type: 'life-good' });
   }
 
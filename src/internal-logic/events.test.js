@@ -4,76 +4,21 @@
  * Run: npm test
  */
 
-import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { describe, it, expect, assert, beforeAll, afterAll, beforeEach } from 'vitest';
 import { Human, create_human } from './human.js';
 import {
   make_events, apply_decay, apply_event, nt_boost,
-  compute_receptivity, get_effective_baselines,
-  setEnableProbabilistic, getEnableProbabilistic,
+  setEnableProbabilistic, getEnableProbabilistic, setRandom,
 } from './events.js';
+import { apply_n_times, run_sequence, decay_only } from './test-helpers.js';
 
-// =============================================================================
-// HELPERS
-// =============================================================================
-
-function apply_n_times(human, event_name, events, n) {
-  const event = events[event_name];
-  for (let i = 0; i < n; i++) {
-    if (event.can_apply(human)) {
-      apply_event(human, event_name, event);
-      apply_decay(human, event.duration);
-      human.clamp_values();
-    }
-  }
-}
-
-function run_sequence(human, sequence, events) {
-  for (const event_name of sequence) {
-    const event = events[event_name];
-    if (event.can_apply(human)) {
-      apply_event(human, event_name, event);
-      apply_decay(human, event.duration);
-      human.clamp_values();
-    }
-  }
-}
-
-function decay_only(human, hours, dt = 0.1) {
-  const steps = Math.floor(hours / dt);
-  for (let i = 0; i < steps; i++) {
-    apply_decay(human, dt);
-    human.clamp_values();
-  }
-}
+// Event names are needed at collection time to generate per-event cases
+const EVENT_NAMES = Object.keys(make_events());
 
-/**
- * Deep copy a Human, copying all primitive fields and deeply cloning
- * tolerance, reserves, cue_salience objects, and active_effects/rebound_queue arrays.
- */
-function deepCopyHuman(human) {
-  const copy = new Human();
-  // Copy all primitive fields
-  const primitiveFields = [
-    'testosterone', 'ssri_level', 'life_stress',
-    'dopamine', 'oxytocin', 'endorphins', 'serotonin',
-    'prolactin', 'vasopressin', 'arousal', 'prefrontal',
-    'sleepiness', 'anxiety', 'absorption', 'hunger', 'energy',
-    'physical_health', 'psychological_health',
-    'time_since_orgasm', 'edging_buildup', 'digesting',
-    'sexual_inhibition', 'shutdown',
-  ];
-  for (const field of primitiveFields) {
-    copy[field] = human[field];
-  }
-  // Deep copy object fields
-  copy.tolerance = { ...human.tolerance };
-  copy.reserves = { ...human.reserves };
-  copy.cue_salience = { ...human.cue_salience };
-  // Deep copy arrays (and their object contents)
-  copy.active_effects = human.active_effects.map(e => ({ ...e }));
-  copy.rebound_queue = human.rebound_queue.map(r => ({ ...r }));
-  return copy;
-}
+const DRUG_NAMES = Object.freeze([
+  'mdma', 'weed', 'mushrooms', 'lsd', 'poppers', 'ketamine',
+  'tobacco', 'caffeine', 'alcohol', 'amphetamines', 'cocaine', 'nitrous',
+]);
 
 // =============================================================================
 // AXIOM TESTS
@@ -84,42 +29,60 @@ describe('Axioms', () => {
   let events;
   let origProb;
 
-  beforeEach(() => {
+  // Events are stateless (name, duration, pure apply/can_apply closures),
+  // so one catalog is shared by every test in this block.
+  beforeAll(() => {
+    events = make_events();
     origProb = getEnableProbabilistic();
     setEnableProbabilistic(false);
-    human = new Human();
-    events = make_events();
   });
 
-  afterEach(() => {
+  afterAll(() => {
     setEnableProbabilistic(origProb);
   });
 
+  beforeEach(() => {
+    human = new Human();
+  });
+
+  // axiom0 and the final axiom both spam one event from a fresh Human, and
+  // their first 30 steps are the same trajectory. One 50-step run per event
+  // collects the windows both compare, cached for the lifetime of the block.
+  const spam_histories = new Map();
+  function spam_history(event_name) {
+    let hist = spam_histories.get(event_name);
+    if (hist) return hist;
+    const h = new Human();
+    const event = events[event_name];
+    const duration = event.duration;
+    hist = { mid_sum: 0.0, late_sum: 0.0, first_10: 0.0, last_10: 0.0 };
+    for (let i = 0; i < 50; i++) {
+      if (event.can_apply(h)) {
+        apply_event(h, event_name, event);
+        // Final axiom: pleasure right after each application, blocks 0-9 / 20-29
+        if (i < 10) hist.first_10 += h.pleasure_score() * duration;
+        else if (i >= 20 && i < 30) hist.last_10 += h.pleasure_score() * duration;
+        apply_decay(h, duration);
+        h.clamp_values();
+      }
+      // Axiom 0: settled pleasure per step, windows 10-19 / 40-49
+      if (i >= 40) hist.late_sum += h.pleasure_score();
+      else if (i >= 10 && i < 20) hist.mid_sum += h.pleasure_score();
+    }
+    spam_histories.set(event_name, hist);
+    return hist;
+  }
+
   // -----------------------------------------------------------------
   // Axiom 0: No trivially exploitable loop
   // -----------------------------------------------------------------
-  it('test_axiom0_no_trivial_exploit', () => {
-    for (const event_name of Object.keys(events)) {
-      const h = new Human();
-      const pleasures = [];
-      for (let i = 0; i < 50; i++) {
-        const event = events[event_name];
-        if (event.can_apply(h)) {
-          apply_event(h, event_name, event);
-          apply_decay(h, event.duration);
-          h.clamp_values();
-        }
-        pleasures.push(h.pleasure_score());
-      }
-
-      if (pleasures.length >= 50) {
-        const mid_avg = pleasures.slice(10, 20).reduce((a, b) => a + b, 0) / 10;
-        const late_avg = pleasures.slice(40, 50).reduce((a, b) => a + b, 0) / 10;
-        expect(late_avg).toBeLessThanOrEqual(
-          mid_avg * 1.15,
-          `Action '${event_name}' shows unbounded growth: mid_avg=${mid_avg.toFixed(1)}, late_avg=${late_avg.toFixed(1)}`
-        );
-      }
+  it.each(EVENT_NAMES)('test_axiom0_no_trivial_exploit[%s]', (event_name) => {
+    const { mid_sum, late_sum } = spam_history(event_name);
+    const mid_avg = mid_sum / 10;
+    const late_avg = late_sum / 10;
+    // Message is only formatted on failure
+    if (!(late_avg <= mid_avg * 1.15)) {
+      assert.fail(`Action '${event_name}' shows unbounded growth: mid_avg=${mid_avg.toFixed(1)}, late_avg=${late_avg.toFixed(1)}`);
     }
   });
 
@@ -161,22 +124,25 @@ describe('Axioms', () => {
   // -----------------------------------------------------------------
   it('test_axiom3_cant_repeat_forever', () => {
     const h = new Human();
-    const gains = [];
+    const event = events['light_stimulation'];
+    const duration = event.duration;
+    let early_sum = 0.0;
+    let late_sum = 0.0;
 
     for (let i = 0; i < 15; i++) {
       const before = h.pleasure_score();
-      const event = events['light_stimulation'];
       if (event.can_apply(h)) {
         apply_event(h, 'light_stimulation', event);
-        apply_decay(h, event.duration);
+        apply_decay(h, duration);
         h.clamp_values();
       }
-      const after = h.pleasure_score();
-      gains.push(after - before);
+      const gain = h.pleasure_score() - before;
+      if (i < 5) early_sum += gain;
+      else if (i >= 10) late_sum += gain;
     }
 
-    const early_gains = gains.slice(0, 5).reduce((a, b) => a + b, 0) / 5;
-    const late_gains = gains.slice(10, 15).reduce((a, b) => a + b, 0) / 5;
+    const early_gains = early_sum / 5;
+    const late_gains = late_sum / 5;
     expect(late_gains).toBeLessThan(early_gains);
   });
 
@@ -335,15 +301,15 @@ describe('Axioms', () => {
     base.oxytocin = 40;
     base.serotonin = 55;
 
-    const h_zero = deepCopyHuman(base);
+    const h_zero = base.clone();
     h_zero.anxiety = 0;
     const p_zero = h_zero.pleasure_score();
 
-    const h_moderate = deepCopyHuman(base);
+    const h_moderate = base.clone();
     h_moderate.anxiety = 35;
     const p_moderate = h_moderate.pleasure_score();
 
-    const h_high = deepCopyHuman(base);
+    const h_high = base.clone();
     h_high.anxiety = 80;
     const p_high = h_high.pleasure_score();
 
@@ -428,33 +394,11 @@ describe('Axioms', () => {
   // -----------------------------------------------------------------
   // Final Axiom: No dominant strategy
   // -----------------------------------------------------------------
-  it('test_final_no_dominant_strategy', () => {
-    for (const event_name of Object.keys(events)) {
-      const h = new Human();
-      const pleasures_per_5 = [];
-      let block_pleasure = 0.0;
+  it.each(EVENT_NAMES)('test_final_no_dominant_strategy[%s]', (event_name) => {
+    const { first_10, last_10 } = spam_history(event_name);
 
-      for (let i = 0; i < 30; i++) {
-        const event = events[event_name];
-        if (event.can_apply(h)) {
-          apply_event(h, event_name, event);
-          block_pleasure += h.pleasure_score() * event.duration;
-          apply_decay(h, event.duration);
-          h.clamp_values();
-        }
-
-        if ((i + 1) % 10 === 0) {
-          pleasures_per_5.push(block_pleasure);
-          block_pleasure = 0.0;
-        }
-      }
-
-      if (pleasures_per_5.length >= 3) {
-        expect(pleasures_per_5[2]).toBeLessThanOrEqual(
-          pleasures_per_5[0] * 1.3,
-          `Spamming '${event_name}' shows unbounded growth: first_10=${pleasures_per_5[0].toFixed(1)}, last_10=${pleasures_per_5[2].toFixed(1)}`
-        );
-      }
+    if (!(last_10 <= first_10 * 1.3)) {
+      assert.fail(`Spamming '${event_name}' shows unbounded growth: first_10=${first_10.toFixed(1)}, last_10=${last_10.toFixed(1)}`);
     }
   });
 });
@@ -463,13 +407,44 @@ describe('Axioms', () => {
 // NEW MECHANICS TESTS
 // =============================================================================
 
+describe('Clone', () => {
+  it('test_clone_copies_state', () => {
+    const h = create_human(70, 20, 10);
+    h.dopamine = 77;
+    h.tolerance['sexual'] = 0.4;
+    nt_boost(h, 'dopamine', 20);
+    const c = h.clone();
+    expect(c).toBeInstanceOf(Human);
+    expect(JSON.stringify(c)).toBe(JSON.stringify(h));
+  });
+
+  it('test_clone_is_independent', () => {
+    const h = new Human();
+    nt_boost(h, 'dopamine', 20);
+    const c = h.clone();
+    c.reserves['dopamine'] = 0;
+    c.tolerance['drugs'] = 0.9;
+    c.cue_salience['food'] = 0.9;
+    apply_decay(c, 1.0);
+    expect(h.reserves['dopamine']).toBeGreaterThan(0);
+    expect(h.tolerance['drugs']).toBe(0);
+    expect(h.cue_salience['food']).toBe(0);
+    // Decaying the clone must not advance the original's queued effects
+    expect(h.active_effects[0].remaining_hours).toBe(0.25);
+    expect(h.rebound_queue[0].delay_remaining).toBe(0.5);
+  });
+});
+
 describe('OpponentProcess', () => {
   let human;
   let events;
 
+  beforeAll(() => {
+    events = make_events();
+  });
+
   beforeEach(() => {
     human = new Human();
-    events = make_events();
   });
 
   it('test_rebound_scheduled_on_large_boost', () => {
@@ -511,36 +486,27 @@ describe('DrugEvents', () => {
   let events;
   let origProb;
 
-  beforeEach(() => {
-    human = new Human();
+  // Shared read-only catalog; deterministic outcomes for the whole block
+  beforeAll(() => {
     events = make_events();
-    // Disable probabilistic outcomes for deterministic tests
     origProb = getEnableProbabilistic();
     setEnableProbabilistic(false);
   });
 
-  afterEach(() => {
+  afterAll(() => {
     setEnableProbabilistic(origProb);
   });
 
-  it('test_all_drugs_exist', () => {
-    const drug_names = [
-      'mdma', 'weed', 'mushrooms', 'lsd', 'poppers', 'ketamine',
-      'tobacco', 'caffeine', 'alcohol', 'amphetamines', 'cocaine', 'nitrous'
-    ];
-    for (const name of drug_names) {
-      expect(events).toHaveProperty(name);
-    }
+  beforeEach(() => {
+    human = new Human();
   });
 
-  it('test_drugs_have_category', () => {
-    const drug_names = [
-      'mdma', 'weed', 'mushrooms', 'lsd', 'poppers', 'ketamine',
-      'tobacco', 'caffeine', 'alcohol', 'amphetamines', 'cocaine', 'nitrous'
-    ];
-    for (const name of drug_names) {
-      expect(events[name].category).toBe('drugs');
-    }
+  it.each(DRUG_NAMES)('test_all_drugs_exist[%s]', (name) => {
+    expect(events).toHaveProperty(name);
+  });
+
+  it.each(DRUG_NAMES)('test_drugs_have_category[%s]', (name) => {
+    expect(events[name].category).toBe('drugs');
   });
 
   it('test_mdma_boosts_serotonin_and_oxytocin', () => {
@@ -592,32 +558,33 @@ describe('DrugEvents', () => {
   });
 
   it('test_drugs_no_trivial_exploit', () => {
-    const drug_names = [
-      'mdma', 'weed', 'mushrooms', 'lsd', 'poppers', 'ketamine',
-      'tobacco', 'caffeine', 'alcohol', 'amphetamines', 'cocaine', 'nitrous'
-    ];
-    for (const drug_name of drug_names) {
+    for (const drug_name of DRUG_NAMES) {
       const h = new Human();
       h.energy = 90;
-      const pleasures = [];
-      for (let i = 0; i < 30; i++) {
-        const event = events[drug_name];
+      const event = events[drug_name];
+      const duration = event.duration;
+      // Only steps 5-9 and 15-19 are compared, so stop once step 19 is scored
+      let mid_sum = 0.0;
+      let late_sum = 0.0;
+      let steps = 0;
+      while (steps < 20) {
         if (event.can_apply(h)) {
           apply_event(h, drug_name, event);
-          apply_decay(h, event.duration);
+          apply_decay(h, duration);
           h.clamp_values();
         }
-        pleasures.push(h.pleasure_score());
+        if (steps >= 15) late_sum += h.pleasure_score();
+        else if (steps >= 5 && steps < 10) mid_sum += h.pleasure_score();
+        steps++;
         if (!h.is_viable()) break;
       }
 
-      if (pleasures.length >= 20) {
-        const mid_avg = pleasures.slice(5, 10).reduce((a, b) => a + b, 0) / 5;
-        const late_avg = pleasures.slice(15, 20).reduce((a, b) => a + b, 0) / 5;
-        expect(late_avg).toBeLessThanOrEqual(
-          mid_avg * 1.2,
-          `Drug '${drug_name}' shows unbounded growth: mid=${mid_avg.toFixed(1)}, late=${late_avg.toFixed(1)}`
-        );
+      if (steps === 20) {
+        const mid_avg = mid_sum / 5;
+        const late_avg = late_sum / 5;
+        if (!(late_avg <= mid_avg * 1.2)) {
+          assert.fail(`Drug '${drug_name}' shows unbounded growth: mid=${mid_avg.toFixed(1)}, late=${late_avg.toFixed(1)}`);
+        }
       }
     }
   });
@@ -627,41 +594,44 @@ describe('ProbabilisticOutcomes', () => {
   it('test_probabilistic_flag_disables_randomness', () => {
     setEnableProbabilistic(false);
     try {
-      const h = new Human();
-      h.arousal = 90;
       const events = make_events();
-      // Run intense_stimulation many times - should never trigger orgasm
-      for (let i = 0; i < 100; i++) {
+      // Three different draws, including 0 (which would always trigger with the
+      // flag on), must give the same outcome and never a premature orgasm
+      const deltas = [];
+      for (const draw of [() => 0, () => 0.5, null]) {
+        setRandom(draw);
+        const h = new Human();
+        h.arousal = 90;
+        h.energy = 80;
         const initial_prolactin = h.prolactin;
         events['intense_stimulation'].apply(h, 1.0);
-        // If orgasm was triggered, prolactin would spike
-        expect(h.prolactin).toBeLessThan(initial_prolactin + 40);
-        h.clamp_values();
-        h.arousal = 90;  // keep arousal high
-        h.energy = 80;   // keep energy up
+        deltas.push(h.prolactin - initial_prolactin);
       }
+      // If orgasm was triggered, prolactin would spike
+      expect(deltas[0]).toBeLessThan(40);
+      expect(deltas[1]).toBe(deltas[0]);
+      expect(deltas[2]).toBe(deltas[0]);
     } finally {
+      setRandom(null);
       setEnableProbabilistic(true);
     }
   });
 
   it('test_probabilistic_can_trigger', () => {
     setEnableProbabilistic(true);
-    const events = make_events();
-    // Try many attempts to find one that triggers premature orgasm
-    let triggered = false;
-    for (let seed = 0; seed < 1000; seed++) {
+    // A draw of 0 is below every trigger probability, so one attempt must fire
+    setRandom(() => 0);
+    try {
+      const events = make_events();
       const h = new Human();
       h.arousal = 90;
       h.energy = 80;
       const initial_prolactin = h.prolactin;
       events['intense_stimulation'].apply(h, 1.0);
-      if (h.prolactin > initial_prolactin + 30) {
-        triggered = true;
-        break;
-      }
+      expect(h.prolactin).toBeGreaterThan(initial_prolactin + 30);
+    } finally {
+      setRandom(null);
     }
-    expect(triggered).toBe(true);
   });
 });
 
@@ -674,17 +644,21 @@ describe('CueLearning', () => {
   let events;
   let origProb;
 
-  beforeEach(() => {
-    human = new Human();
+  // Shared read-only catalog; deterministic outcomes for the whole block
+  beforeAll(() => {
     events = make_events();
     origProb = getEnableProbabilistic();
     setEnableProbabilistic(false);
   });
 
-  afterEach(() => {
+  afterAll(() => {
     setEnableProbabilistic(origProb);
   });
 
+  beforeEach(() => {
+    human = new Human();
+  });
+
   it('test_cue_salience_increases_with_use', () => {
     const h = human;
     const initial_salience = h.cue_salience['sexual'];
@@ -734,296 +708,6 @@ describe('CueLearning', () => {
   });
 });
 
-// =============================================================================
-// CONTEXT RECEPTIVITY TESTS
-// =============================================================================
-
-describe('ContextReceptivity', () => {
-  let events;
-  let origProb;
-
-  beforeEach(() => {
-    events = make_events();
-    origProb = getEnableProbabilistic();
-    setEnableProbabilistic(false);
-  });
-
-  afterEach(() => {
-    setEnableProbabilistic(origProb);
-  });
-
-  it('test_sexual_stim_during_high_anxiety_is_worse', () => {
-    // Calm human
-    const h_calm = new Human();
-    h_calm.anxiety = 20;
-    h_calm.arousal = 40;
-    apply_event(h_calm, 'light_stimulation', events['light_stimulation']);
-    const calm_pleasure = h_calm.pleasure_score();
-
-    // Panicking human
-    const h_panic = new Human();
-    h_panic.anxiety = 80;
-    h_panic.arousal = 40;
-    apply_event(h_panic, 'light_stimulation', events['light_stimulation']);
-    const panic_pleasure = h_panic.pleasure_score();
-
-    expect(calm_pleasure).toBeGreaterThan(panic_pleasure);
-  });
-
-  it('test_sexual_stim_during_panic_increases_anxiety', () => {
-    const h = new Human();
-    h.anxiety = 95;
-    h.arousal = 40;
-    const initial_anxiety = h.anxiety;
-    apply_event(h, 'light_stimulation', events['light_stimulation']);
-    expect(h.anxiety).toBeGreaterThan(initial_anxiety);
-  });
-
-  it('test_pain_without_arousal_is_unpleasant', () => {
-    const h = new Human();
-    h.arousal = 10;  // very low arousal
-    h.absorption = 10;
-    h.anxiety = 35;  // start at Yerkes-Dodson optimum so backfire can only hurt
-    const before = h.pleasure_score();
-    apply_event(h, 'light_pain', events['light_pain']);
-    h.clamp_values();
-    const after = h.pleasure_score();
-    expect(after).toBeLessThan(before);
-  });
-
-  it('test_pain_with_arousal_is_pleasurable', () => {
-    const h = new Human();
-    h.arousal = 60;
-    h.absorption = 50;
-    h.anxiety = 20;
-    const before = h.pleasure_score();
-    apply_event(h, 'light_pain', events['light_pain']);
-    const after = h.pleasure_score();
-    expect(after).toBeGreaterThan(before);
-  });
-
-  it('test_social_interaction_during_anxiety_backfires', () => {
-    // Calm human
-    const h_calm = new Human();
-    h_calm.anxiety = 15;
-    h_calm.oxytocin = 40;
-    const calm_before = h_calm.pleasure_score();
-    apply_event(h_calm, 'cuddling', events['cuddling']);
-    const calm_gain = h_calm.pleasure_score() - calm_before;
-
-    // Anxious human
-    const h_anxious = new Human();
-    h_anxious.anxiety = 80;
-    h_anxious.oxytocin = 40;
-    const anxious_before = h_anxious.pleasure_score();
-    apply_event(h_anxious, 'cuddling', events['cuddling']);
-    const anxious_gain = h_anxious.pleasure_score() - anxious_before;
-
-    expect(calm_gain).toBeGreaterThan(anxious_gain);
-  });
-
-  it('test_context_setup_matters_for_sexual_sequence', () => {
-    // Cold start: just spam stimulation
-    const h_cold = new Human();
-    run_sequence(h_cold, [
-      'light_stimulation', 'light_stimulation', 'light_stimulation',
-    ], events);
-    const cold_pleasure = h_cold.pleasure_score();
-
-    // Warm start: build context first
-    const h_warm = new Human();
-    run_sequence(h_warm, [
-      'cuddling', 'massage', 'light_stimulation',
-    ], events);
-    const warm_pleasure = h_warm.pleasure_score();
-
-    expect(warm_pleasure).toBeGreaterThan(cold_pleasure);
-  });
-
-  it('test_psychedelics_during_anxiety_less_effective', () => {
-    // Calm human
-    const h_calm = new Human();
-    h_calm.energy = 60;
-    h_calm.anxiety = 20;
-    const calm_before = h_calm.pleasure_score();
-    apply_event(h_calm, 'mushrooms', events['mushrooms']);
-    const calm_gain = h_calm.pleasure_score() - calm_before;
-
-    // Anxious human
-    const h_anxious = new Human();
-    h_anxious.energy = 60;
-    h_anxious.anxiety = 70;
-    h_anxious.psychological_health = 30;
-    const anxious_before = h_anxious.pleasure_score();
-    apply_event(h_anxious, 'mushrooms', events['mushrooms']);
-    const anxious_gain = h_anxious.pleasure_score() - anxious_before;
-
-    expect(calm_gain).toBeGreaterThan(anxious_gain);
-  });
-
-  it('test_receptivity_values_at_default_state', () => {
-    const h = new Human();
-    // Default state: anxiety=30, prefrontal=50, arousal=20, absorption=30
-    expect(Math.abs(compute_receptivity(h, 'sexual') - 1.0)).toBeLessThanOrEqual(0.1);
-    expect(Math.abs(compute_receptivity(h, 'social') - 1.0)).toBeLessThanOrEqual(0.1);
-    expect(Math.abs(compute_receptivity(h, 'rest') - 1.0)).toBeLessThanOrEqual(0.1);
-  });
-
-  it('test_receptivity_clamped', () => {
-    const h = new Human();
-    h.anxiety = 100;
-    h.arousal = 0;
-    h.absorption = 0;
-    h.prefrontal = 100;
-    for (const category of ['sexual', 'social', 'pain', 'breathwork', 'food', 'drugs', 'rest']) {
-      const r = compute_receptivity(h, category);
-      expect(r).toBeGreaterThanOrEqual(-0.5);
-      expect(r).toBeLessThanOrEqual(1.0);
-    }
-  });
-});
-
-// =============================================================================
-// TRAIT DYNAMICS TESTS
-// =============================================================================
-
-describe('TraitDynamics', () => {
-  let events;
-  let origProb;
-
-  beforeEach(() => {
-    events = make_events();
-    origProb = getEnableProbabilistic();
-    setEnableProbabilistic(false);
-  });
-
-  afterEach(() => {
-    setEnableProbabilistic(origProb);
-  });
-
-  it('test_high_t_decays_toward_higher_arousal', () => {
-    const h_high = create_human(90);
-    const h_low = create_human(10);
-    // Set both to same arousal, then decay
-    h_high.arousal = 50.0;
-    h_low.arousal = 50.0;
-    decay_only(h_high, 3.0);
-    decay_only(h_low, 3.0);
-    expect(h_high.arousal).toBeGreaterThan(h_low.arousal);
-  });
-
-  it('test_ssri_reduces_dopamine_from_cocaine', () => {
-    const h_ssri = create_human(50, 80);
-    const h_normal = create_human(50, 0);
-    h_ssri.energy = 80;
-    h_normal.energy = 80;
-    h_ssri.dopamine = 50.0;
-    h_normal.dopamine = 50.0;
-    apply_event(h_ssri, 'cocaine', events['cocaine']);
-    apply_event(h_normal, 'cocaine', events['cocaine']);
-    expect(h_ssri.dopamine).toBeLessThan(h_normal.dopamine);
-  });
-
-  it('test_ssri_boosts_serotonin_baseline', () => {
-    const h_ssri = create_human(50, 80);
-    const eb = get_effective_baselines(h_ssri);
-    expect(eb['serotonin']).toBeGreaterThan(50.0);
-  });
-
-  it('test_ssri_emotional_blunting', () => {
-    const h_ssri = create_human(50, 80);
-    const h_normal = create_human(50, 0);
-    // Set identical state except SSRI
-    for (const h of [h_ssri, h_normal]) {
-      h.dopamine = 60;
-      h.endorphins = 50;
-      h.oxytocin = 40;
-      h.serotonin = 55;
-      h.anxiety = 30;
-      h.absorption = 80;  // high absorption to show blunting
-    }
-    const p_ssri = h_ssri.pleasure_score();
-    const p_normal = h_normal.pleasure_score();
-    expect(p_ssri).toBeLessThan(p_normal);
-  });
-
-  it('test_life_stress_reduces_receptivity', () => {
-    const h_stressed = create_human(50, 0, 80);
-    const h_calm = create_human(50, 0, 0);
-    for (const category of ['sexual', 'social', 'food', 'drugs']) {
-      const r_stressed = compute_receptivity(h_stressed, category);
-      const r_calm = compute_receptivity(h_calm, category);
-      expect(r_stressed).toBeLessThan(r_calm);
-    }
-    // Rest should be unaffected
-    expect(Math.abs(
-      compute_receptivity(h_stressed, 'rest') -
-      compute_receptivity(h_calm, 'rest')
-    )).toBeLessThanOrEqual(0.01);
-  });
-
-  it('test_life_stress_absorption_drain', () => {
-    const h = create_human(50, 0, 80);
-    h.absorption = 50.0;
-    const initial = h.absorption;
-    decay_only(h, 1.0);
-    expect(h.absorption).toBeLessThan(initial - 1.0);
-  });
-
-  it('test_life_stress_psych_health_drain', () => {
-    const h = create_human(50, 0, 80);
-    const initial = h.psychological_health;
-    decay_only(h, 2.0);
-    expect(h.psychological_health).toBeLessThan(initial);
-  });
-
-  it('test_ssri_plus_stress_moderate_anxiety', () => {
-    const h_both = create_human(50, 60, 60);
-    const h_stress_only = create_human(50, 0, 60);
-    const h_ssri_only = create_human(50, 60, 0);
-    const eb_both = get_effective_baselines(h_both);
-    const eb_stress = get_effective_baselines(h_stress_only);
-    const eb_ssri = get_effective_baselines(h_ssri_only);
-    // SSRI should partially offset stress anxiety
-    expect(eb_both['anxiety']).toBeLessThan(eb_stress['anxiety']);
-    expect(eb_both['anxiety']).toBeGreaterThan(eb_ssri['anxiety']);
-  });
-
-  it('test_stressed_person_wakes_with_higher_anxiety', () => {
-    const h_stressed = create_human(50, 0, 70);
-    const h_calm = create_human(50, 0, 0);
-    h_stressed.energy = 40;
-    h_stressed.sleepiness = 60;
-    h_calm.energy = 40;
-    h_calm.sleepiness = 60;
-    apply_event(h_stressed, 'sleep', events['sleep']);
-    apply_event(h_calm, 'sleep', events['sleep']);
-    expect(h_stressed.anxiety).toBeGreaterThan(h_calm.anxiety);
-  });
-
-  it('test_ssri_person_wakes_with_higher_prolactin', () => {
-    const h_ssri = create_human(50, 70, 0);
-    const h_normal = create_human(50, 0, 0);
-    h_ssri.energy = 40;
-    h_ssri.sleepiness = 60;
-    h_normal.energy = 40;
-    h_normal.sleepiness = 60;
-    apply_event(h_ssri, 'sleep', events['sleep']);
-    apply_event(h_normal, 'sleep', events['sleep']);
-    expect(h_ssri.prolactin).toBeGreaterThan(h_normal.prolactin);
-  });
-
-  it('test_testosterone_ongoing_vasopressin', () => {
-    const h_high = create_human(90);
-    const h_low = create_human(10);
-    h_high.vasopressin = 40.0;
-    h_low.vasopressin = 40.0;
-    decay_only(h_high, 3.0);
-    decay_only(h_low, 3.0);
-    expect(h_high.vasopressin).toBeGreaterThan(h_low.vasopressin);
-  });
-});
-
 // =============================================================================
 // DYNAMIC TRAIT EVENTS TESTS
 // =============================================================================
@@ -1032,13 +716,14 @@ describe('DynamicTraitEvents', () => {
   let events;
   let origProb;
 
-  beforeEach(() => {
+  // Shared read-only catalog; deterministic outcomes for the whole block
+  beforeAll(() => {
     events = make_events();
     origProb = getEnableProbabilistic();
     setEnableProbabilistic(false);
   });
 
-  afterEach(() => {
+  afterAll(() => {
     setEnableProbabilistic(origProb);
   });
 
@@ -1150,13 +835,14 @@ describe('WantingLiking', () => {
   let events;
   let origProb;
 
-  beforeEach(() => {
+  // Shared read-only catalog; deterministic outcomes for the whole block
+  beforeAll(() => {
     events = make_events();
     origProb = getEnableProbabilistic();
     setEnableProbabilistic(false);
   });
 
-  afterEach(() => {
+  afterAll(() => {
     setEnableProbabilistic(origProb);
   });
 
@@ -3,6 +3,36 @@
  * All values are on a 0-100 scale unless noted otherwise.
  */
 
+/**
+ * Clamp x to [lo, hi] with plain comparisons instead of a Math.max/Math.min pair.
+ */
+export function clamp(x, lo, hi) {
+  return x < lo ? lo : (x > hi ? hi : x);
+}
+
+// Fixed key sets of the per-category and per-NT dicts. Loops walk these frozen
+// arrays instead of allocating Object.keys()/Object.values() on every call.
+export const CATEGORIES = Object.freeze([
+  'sexual', 'pain', 'social', 'breathwork', 'food', 'rest', 'drugs',
+  'medical', 'life',
+]);
+export const RESERVE_NTS = Object.freeze([
+  'dopamine', 'serotonin', 'endorphins', 'oxytocin',
+]);
+
+/**
+ * Yerkes-Dodson optimum from raw trait values, shared by
+ * Human.yerkes_dodson_optimum() and liking_score() (which already has ssri_pct).
+ */
+function yerkes_dodson_optimum_for(testosterone, ssri_pct) {
+  let optimum = 35.0;
+  // High T = lower optimum (less anxiety needed for peak performance)
+  optimum -= (testosterone - 50) / 50 * 5;
+  // SSRI = lower optimum (less anxiety needed)
+  optimum -= ssri_pct * 8;
+  return clamp(optimum, 10.0, 50.0);
+}
+
 export class Human {
   // Fields excluded from 0-100 clamping (unbounded or non-numeric)
   static _UNCLAMPED_FIELDS = new Set([
@@ -21,20 +51,23 @@ export class Human {
     'energy', 'physical_health', 'psychological_health',
     'time_since_orgasm', 'edging_buildup', 'digesting',
     'sexual_inhibition', 'shutdown',
-    'testosterone',  // also a float but in _UNCLAMPED_FIELDS check will skip via the set
-  ];
-
-  // Clamped float fields (subset of _FLOAT_FIELDS, excluding _UNCLAMPED_FIELDS)
-  static _CLAMPED_FLOAT_FIELDS = [
-    'dopamine', 'oxytocin', 'endorphins', 'serotonin',
-    'prolactin', 'vasopressin', 'arousal', 'prefrontal',
-    'sleepiness', 'anxiety', 'absorption', 'hunger',
-    'energy', 'physical_health', 'psychological_health',
-    'edging_buildup', 'digesting',
-    'sexual_inhibition', 'shutdown',
     'testosterone',
   ];
 
+  // Clamped float fields (subset of _FLOAT_FIELDS, excluding _UNCLAMPED_FIELDS).
+  // Computed once at class definition so clamp_values() never filters per call.
+  static _CLAMPED_FLOAT_FIELDS = Object.freeze(
+    this._FLOAT_FIELDS.filter((f) => !this._UNCLAMPED_FIELDS.has(f))
+  );
+
+  // Straight-line clamp of the float fields, generated once from the list above
+  // so each field is a direct property access rather than a this[name] lookup.
+  static _clamp_float_fields = new Function(
+    'let v;\n' + this._CLAMPED_FLOAT_FIELDS.map((f) =>
+      `v = this.${f}; this.${f} = v < 0 ? 0 : (v > 100 ? 100 : v);`
+    ).join('\n')
+  );
+
   constructor({
     testosterone = 50.0,
     ssri_level = 0.0,
@@ -105,22 +138,46 @@ export class Human {
     this.shutdown = shutdown;           // 0 = normal, 100 = full dorsal collapse
 
     // === PHYSIOLOGICAL REALISM ===
-    this.tolerance = {
+    // Keyed dicts are sealed too: their key sets are CATEGORIES / RESERVE_NTS
+    this.tolerance = Object.seal({
       sexual: 0.0, pain: 0.0, social: 0.0,
       breathwork: 0.0, food: 0.0, rest: 0.0, drugs: 0.0,
       medical: 0.0, life: 0.0,
-    };
-    this.reserves = {
+    });
+    this.reserves = Object.seal({
       dopamine: 100.0, serotonin: 100.0,
       endorphins: 100.0, oxytocin: 100.0,
-    };
+    });
     this.active_effects = [];
     this.rebound_queue = [];
-    this.cue_salience = {
+    this.cue_salience = Object.seal({
       sexual: 0.0, pain: 0.0, social: 0.0,
       breathwork: 0.0, food: 0.0, rest: 0.0, drugs: 0.0,
       medical: 0.0, life: 0.0,
-    };
+    });
+
+    // Fixed field set (the JS analogue of __slots__): keeps every instance on
+    // one hidden class and turns a typo'd attribute write into a TypeError.
+    Object.seal(this);
+  }
+
+  clone() {
+    /**
+     * Fast independent copy for branching several variants off one state
+     * (e.g. the Yerkes-Dodson test). Scalars are copied directly; the dicts and
+     * effect queues are copied so the clone never shares mutable state with this.
+     */
+    const copy = new Human();
+    // Reuse the fresh instance's dicts so the copy keeps the constructor's shape
+    const { tolerance, reserves, cue_salience } = copy;
+    Object.assign(copy, this);
+    copy.tolerance = Object.assign(tolerance, this.tolerance);
+    copy.reserves = Object.assign(reserves, this.reserves);
+    copy.cue_salience = Object.assign(cue_salience, this.cue_salience);
+    // Effects are mutated in place by apply_decay, so copy each entry too
+    copy.active_effects = this.active_effects.map((e) => ({ ...e }));
+    copy.rebound_queue = this.rebound_queue.map((r) => ({ ...r }));
+    return copy;
   }
 
   clamp_values() {
@@ -129,18 +186,17 @@ export class Human {
      * Float fields are clamped to [0, 100] by default.
      * Dict fields have their own bounds.
      */
-    for (const fieldName of Human._CLAMPED_FLOAT_FIELDS) {
-      this[fieldName] = Math.max(0, Math.min(100, this[fieldName]));
-    }
+    Human._clamp_float_fields.call(this);
 
-    for (const k of Object.keys(this.reserves)) {
-      this.reserves[k] = Math.max(0, Math.min(100, this.reserves[k]));
-    }
-    for (const k of Object.keys(this.tolerance)) {
-      this.tolerance[k] = Math.max(0.0, Math.min(1.0, this.tolerance[k]));
+    const reserves = this.reserves;
+    for (const k of RESERVE_NTS) {
+      reserves[k] = clamp(reserves[k], 0, 100);
     }
-    for (const k of Object.keys(this.cue_salience)) {
-      this.cue_salience[k] = Math.max(0.0, Math.min(1.0, this.cue_salience[k]));
+    const tolerance = this.tolerance;
+    const cue_salience = this.cue_salience;
+    for (const k of CATEGORIES) {
+      tolerance[k] = clamp(tolerance[k], 0.0, 1.0);
+      cue_salience[k] = clamp(cue_salience[k], 0.0, 1.0);
     }
   }
 
@@ -149,13 +205,7 @@ export class Human {
      * Individualized optimal anxiety level for Yerkes-Dodson curve.
      * Base: 35. Modified by testosterone and SSRI.
      */
-    let optimum = 35.0;
-    // High T = lower optimum (less anxiety needed for peak performance)
-    optimum -= (this.testosterone - 50) / 50 * 5;
-    // SSRI = lower optimum (less anxiety needed)
-    const ssri_pct = this.ssri_level / 100.0;
-    optimum -= ssri_pct * 8;
-    return Math.max(10.0, Math.min(50.0, optimum));
+    return yerkes_dodson_optimum_for(this.testosterone, this.ssri_level / 100.0);
   }
 
   liking_score() {
@@ -164,33 +214,30 @@ export class Human {
      * Weighted combination of hedonic neurotransmitters (excludes dopamine),
      * modulated by anxiety (Yerkes-Dodson) and absorption (amplifies experience).
      */
-    const base_liking = (
-      this.endorphins * 0.40 +     // hedonic "liking" signal
-      this.oxytocin * 0.25 +       // bonding/warmth
-      this.serotonin * 0.35        // contentment/wellbeing
-    );
-
-    // Yerkes-Dodson inverted-U: individualized optimum
-    const optimum = this.yerkes_dodson_optimum();
-    let anxiety_factor;
-    if (this.anxiety <= optimum) {
-      // Rising: 0.92 at anxiety=0, 1.05 at optimum
-      anxiety_factor = 0.92 + (this.anxiety / optimum) * 0.13;
-    } else {
-      // Falling: 1.05 at optimum, 0.60 at anxiety=100
-      anxiety_factor = 1.05 - ((this.anxiety - optimum) / (100 - optimum)) * 0.45;
-    }
-
-    // Absorption bonus: high absorption amplifies pleasure
-    // SSRI halves the absorption amplification (emotional blunting)
+    // Traits can change mid-run (take_ssri, testosterone_injection), so they
+    // are read per call, but the SSRI fraction is derived only once here
     const ssri_pct = this.ssri_level / 100.0;
-    const max_bonus = 0.3 * (1 - ssri_pct * 0.5);
-    const absorption_factor = 1.0 + (this.absorption / 100) * max_bonus;
 
-    // Shutdown (dorsal vagal): numbs all valence
-    const shutdown_factor = 1.0 - (this.shutdown / 100) * 0.8;
+    // Yerkes-Dodson inverted-U: individualized optimum.
+    // Continuous piecewise-linear ramp written without a branch (Math.min/max
+    // compile to plain float min/max): 0.92 at anxiety=0, rising to 1.05 at
+    // the optimum, then falling to 0.60 at anxiety=100.
+    const optimum = yerkes_dodson_optimum_for(this.testosterone, ssri_pct);
+    const anxiety = this.anxiety;
 
-    return base_liking * anxiety_factor * absorption_factor * shutdown_factor;
+    return (
+      // Base: hedonic "liking" signal, bonding/warmth, contentment/wellbeing
+      (this.endorphins * 0.40 + this.oxytocin * 0.25 + this.serotonin * 0.35) *
+      // Anxiety factor (Yerkes-Dodson)
+      (0.92 +
+        (Math.min(anxiety, optimum) / optimum) * 0.13 -
+        (Math.max(0.0, anxiety - optimum) / (100 - optimum)) * 0.45) *
+      // Absorption bonus: high absorption amplifies pleasure
+      // SSRI halves the absorption amplification (emotional blunting)
+      (1.0 + (this.absorption / 100) * 0.3 * (1 - ssri_pct * 0.5)) *
+      // Shutdown (dorsal vagal): numbs all valence
+      (1.0 - (this.shutdown / 100) * 0.8)
+    );
   }
 
   wanting_score() {
@@ -205,8 +252,12 @@ export class Human {
     );
 
     // Add cue salience contribution (max salience across categories)
-    const salience_values = Object.values(this.cue_salience);
-    const max_salience = salience_values.length > 0 ? Math.max(...salience_values) : 0;
+    const cue_salience = this.cue_salience;
+    let max_salience = cue_salience[CATEGORIES[0]];
+    for (let i = 1; i < CATEGORIES.length; i++) {
+      const v = cue_salience[CATEGORIES[i]];
+      if (v > max_salience) max_salience = v;
+    }
     base_wanting += max_salience * 25;  // up to +25 from learned wanting
 
     // Prolactin suppression (refractory/satiation dampens wanting)
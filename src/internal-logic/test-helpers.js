@@ -0,0 +1,35 @@
+/**
+ * Shared simulation helpers for the test files.
+ */
+
+import { apply_decay, apply_event } from './events.js';
+
+export function apply_n_times(human, event_name, events, n) {
+  const event = events[event_name];
+  for (let i = 0; i < n; i++) {
+    if (event.can_apply(human)) {
+      apply_event(human, event_name, event);
+      apply_decay(human, event.duration);
+      human.clamp_values();
+    }
+  }
+}
+
+export function run_sequence(human, sequence, events) {
+  for (const event_name of sequence) {
+    const event = events[event_name];
+    if (event.can_apply(human)) {
+      apply_event(human, event_name, event);
+      apply_decay(human, event.duration);
+      human.clamp_values();
+    }
+  }
+}
+
+export function decay_only(human, hours, dt = 0.1) {
+  const steps = Math.floor(hours / dt);
+  for (let i = 0; i < steps; i++) {
+    apply_decay(human, dt);
+    human.clamp_values();
+  }
+}
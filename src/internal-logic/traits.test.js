@@ -0,0 +1,315 @@
+/**
+ * Hedonistic Tamagotchi - Receptivity & Trait Tests
+ * Context-dependent receptivity and trait-driven baseline dynamics. Kept in
+ * their own file so vitest can run them in a separate worker from the axioms.
+ * Run: npm test
+ */
+
+import { describe, it, expect, beforeAll, afterAll } from 'vitest';
+import { Human, create_human } from './human.js';
+import {
+  make_events, apply_event,
+  compute_receptivity, get_effective_baselines,
+  setEnableProbabilistic, getEnableProbabilistic,
+} from './events.js';
+import { run_sequence, decay_only } from './test-helpers.js';
+
+// Category lists are needed at collection time to generate per-category cases
+const RECEPTIVITY_CATEGORIES = Object.freeze([
+  'sexual', 'social', 'pain', 'breathwork', 'food', 'drugs', 'rest',
+]);
+const STRESS_GATED_CATEGORIES = Object.freeze(['sexual', 'social', 'food', 'drugs']);
+
+// =============================================================================
+// CONTEXT RECEPTIVITY TESTS
+// =============================================================================
+
+describe('ContextReceptivity', () => {
+  let events;
+  let origProb;
+  let extreme_human;
+
+  // Shared read-only catalog; deterministic outcomes for the whole block
+  beforeAll(() => {
+    events = make_events();
+    origProb = getEnableProbabilistic();
+    setEnableProbabilistic(false);
+    // Worst-case receptivity state, frozen since compute_receptivity only reads
+    const h = new Human();
+    h.anxiety = 100;
+    h.arousal = 0;
+    h.absorption = 0;
+    h.prefrontal = 100;
+    extreme_human = Object.freeze(h);
+  });
+
+  afterAll(() => {
+    setEnableProbabilistic(origProb);
+  });
+
+  it('test_sexual_stim_during_high_anxiety_is_worse', () => {
+    // Calm human
+    const h_calm = new Human();
+    h_calm.anxiety = 20;
+    h_calm.arousal = 40;
+    apply_event(h_calm, 'light_stimulation', events['light_stimulation']);
+    const calm_pleasure = h_calm.pleasure_score();
+
+    // Panicking human
+    const h_panic = new Human();
+    h_panic.anxiety = 80;
+    h_panic.arousal = 40;
+    apply_event(h_panic, 'light_stimulation', events['light_stimulation']);
+    const panic_pleasure = h_panic.pleasure_score();
+
+    expect(calm_pleasure).toBeGreaterThan(panic_pleasure);
+  });
+
+  it('test_sexual_stim_during_panic_increases_anxiety', () => {
+    const h = new Human();
+    h.anxiety = 95;
+    h.arousal = 40;
+    const initial_anxiety = h.anxiety;
+    apply_event(h, 'light_stimulation', events['light_stimulation']);
+    expect(h.anxiety).toBeGreaterThan(initial_anxiety);
+  });
+
+  it('test_pain_without_arousal_is_unpleasant', () => {
+    const h = new Human();
+    h.arousal = 10;  // very low arousal
+    h.absorption = 10;
+    h.anxiety = 35;  // start at Yerkes-Dodson optimum so backfire can only hurt
+    const before = h.pleasure_score();
+    apply_event(h, 'light_pain', events['light_pain']);
+    h.clamp_values();
+    const after = h.pleasure_score();
+    expect(after).toBeLessThan(before);
+  });
+
+  it('test_pain_with_arousal_is_pleasurable', () => {
+    const h = new Human();
+    h.arousal = 60;
+    h.absorption = 50;
+    h.anxiety = 20;
+    const before = h.pleasure_score();
+    apply_event(h, 'light_pain', events['light_pain']);
+    const after = h.pleasure_score();
+    expect(after).toBeGreaterThan(before);
+  });
+
+  it('test_social_interaction_during_anxiety_backfires', () => {
+    // Calm human
+    const h_calm = new Human();
+    h_calm.anxiety = 15;
+    h_calm.oxytocin = 40;
+    const calm_before = h_calm.pleasure_score();
+    apply_event(h_calm, 'cuddling', events['cuddling']);
+    const calm_gain = h_calm.pleasure_score() - calm_before;
+
+    // Anxious human
+    const h_anxious = new Human();
+    h_anxious.anxiety = 80;
+    h_anxious.oxytocin = 40;
+    const anxious_before = h_anxious.pleasure_score();
+    apply_event(h_anxious, 'cuddling', events['cuddling']);
+    const anxious_gain = h_anxious.pleasure_score() - anxious_before;
+
+    expect(calm_gain).toBeGreaterThan(anxious_gain);
+  });
+
+  it('test_context_setup_matters_for_sexual_sequence', () => {
+    // Cold start: just spam stimulation
+    const h_cold = new Human();
+    run_sequence(h_cold, [
+      'light_stimulation', 'light_stimulation', 'light_stimulation',
+    ], events);
+    const cold_pleasure = h_cold.pleasure_score();
+
+    // Warm start: build context first
+    const h_warm = new Human();
+    run_sequence(h_warm, [
+      'cuddling', 'massage', 'light_stimulation',
+    ], events);
+    const warm_pleasure = h_warm.pleasure_score();
+
+    expect(warm_pleasure).toBeGreaterThan(cold_pleasure);
+  });
+
+  it('test_psychedelics_during_anxiety_less_effective', () => {
+    // Calm human
+    const h_calm = new Human();
+    h_calm.energy = 60;
+    h_calm.anxiety = 20;
+    const calm_before = h_calm.pleasure_score();
+    apply_event(h_calm, 'mushrooms', events['mushrooms']);
+    const calm_gain = h_calm.pleasure_score() - calm_before;
+
+    // Anxious human
+    const h_anxious = new Human();
+    h_anxious.energy = 60;
+    h_anxious.anxiety = 70;
+    h_anxious.psychological_health = 30;
+    const anxious_before = h_anxious.pleasure_score();
+    apply_event(h_anxious, 'mushrooms', events['mushrooms']);
+    const anxious_gain = h_anxious.pleasure_score() - anxious_before;
+
+    expect(calm_gain).toBeGreaterThan(anxious_gain);
+  });
+
+  it('test_receptivity_values_at_default_state', () => {
+    const h = new Human();
+    // Default state: anxiety=30, prefrontal=50, arousal=20, absorption=30
+    expect(Math.abs(compute_receptivity(h, 'sexual') - 1.0)).toBeLessThanOrEqual(0.1);
+    expect(Math.abs(compute_receptivity(h, 'social') - 1.0)).toBeLessThanOrEqual(0.1);
+    expect(Math.abs(compute_receptivity(h, 'rest') - 1.0)).toBeLessThanOrEqual(0.1);
+  });
+
+  it.each(RECEPTIVITY_CATEGORIES)('test_receptivity_clamped[%s]', (category) => {
+    const r = compute_receptivity(extreme_human, category);
+    expect(r).toBeGreaterThanOrEqual(-0.5);
+    expect(r).toBeLessThanOrEqual(1.0);
+  });
+});
+
+// =============================================================================
+// TRAIT DYNAMICS TESTS
+// =============================================================================
+
+describe('TraitDynamics', () => {
+  let events;
+  let origProb;
+
+  // Shared read-only catalog; deterministic outcomes for the whole block
+  beforeAll(() => {
+    events = make_events();
+    origProb = getEnableProbabilistic();
+    setEnableProbabilistic(false);
+  });
+
+  afterAll(() => {
+    setEnableProbabilistic(origProb);
+  });
+
+  it('test_high_t_decays_toward_higher_arousal', () => {
+    const h_high = create_human(90);
+    const h_low = create_human(10);
+    // Set both to same arousal, then decay
+    h_high.arousal = 50.0;
+    h_low.arousal = 50.0;
+    decay_only(h_high, 3.0);
+    decay_only(h_low, 3.0);
+    expect(h_high.arousal).toBeGreaterThan(h_low.arousal);
+  });
+
+  it('test_ssri_reduces_dopamine_from_cocaine', () => {
+    const h_ssri = create_human(50, 80);
+    const h_normal = create_human(50, 0);
+    h_ssri.energy = 80;
+    h_normal.energy = 80;
+    h_ssri.dopamine = 50.0;
+    h_normal.dopamine = 50.0;
+    apply_event(h_ssri, 'cocaine', events['cocaine']);
+    apply_event(h_normal, 'cocaine', events['cocaine']);
+    expect(h_ssri.dopamine).toBeLessThan(h_normal.dopamine);
+  });
+
+  it('test_ssri_boosts_serotonin_baseline', () => {
+    const h_ssri = create_human(50, 80);
+    const eb = get_effective_baselines(h_ssri);
+    expect(eb['serotonin']).toBeGreaterThan(50.0);
+  });
+
+  it('test_ssri_emotional_blunting', () => {
+    const h_ssri = create_human(50, 80);
+    const h_normal = create_human(50, 0);
+    // Set identical state except SSRI
+    for (const h of [h_ssri, h_normal]) {
+      h.dopamine = 60;
+      h.endorphins = 50;
+      h.oxytocin = 40;
+      h.serotonin = 55;
+      h.anxiety = 30;
+      h.absorption = 80;  // high absorption to show blunting
+    }
+    const p_ssri = h_ssri.pleasure_score();
+    const p_normal = h_normal.pleasure_score();
+    expect(p_ssri).toBeLessThan(p_normal);
+  });
+
+  it.each(STRESS_GATED_CATEGORIES)('test_life_stress_reduces_receptivity[%s]', (category) => {
+    const h_stressed = create_human(50, 0, 80);
+    const h_calm = create_human(50, 0, 0);
+    expect(compute_receptivity(h_stressed, category))
+      .toBeLessThan(compute_receptivity(h_calm, category));
+  });
+
+  it('test_life_stress_leaves_rest_receptivity', () => {
+    const h_stressed = create_human(50, 0, 80);
+    const h_calm = create_human(50, 0, 0);
+    expect(Math.abs(
+      compute_receptivity(h_stressed, 'rest') -
+      compute_receptivity(h_calm, 'rest')
+    )).toBeLessThanOrEqual(0.01);
+  });
+
+  it('test_life_stress_absorption_drain', () => {
+    const h = create_human(50, 0, 80);
+    h.absorption = 50.0;
+    const initial = h.absorption;
+    decay_only(h, 1.0);
+    expect(h.absorption).toBeLessThan(initial - 1.0);
+  });
+
+  it('test_life_stress_psych_health_drain', () => {
+    const h = create_human(50, 0, 80);
+    const initial = h.psychological_health;
+    decay_only(h, 2.0);
+    expect(h.psychological_health).toBeLessThan(initial);
+  });
+
+  it('test_ssri_plus_stress_moderate_anxiety', () => {
+    const h_both = create_human(50, 60, 60);
+    const h_stress_only = create_human(50, 0, 60);
+    const h_ssri_only = create_human(50, 60, 0);
+    const eb_both = get_effective_baselines(h_both);
+    const eb_stress = get_effective_baselines(h_stress_only);
+    const eb_ssri = get_effective_baselines(h_ssri_only);
+    // SSRI should partially offset stress anxiety
+    expect(eb_both['anxiety']).toBeLessThan(eb_stress['anxiety']);
+    expect(eb_both['anxiety']).toBeGreaterThan(eb_ssri['anxiety']);
+  });
+
+  it('test_stressed_person_wakes_with_higher_anxiety', () => {
+    const h_stressed = create_human(50, 0, 70);
+    const h_calm = create_human(50, 0, 0);
+    h_stressed.energy = 40;
+    h_stressed.sleepiness = 60;
+    h_calm.energy = 40;
+    h_calm.sleepiness = 60;
+    apply_event(h_stressed, 'sleep', events['sleep']);
+    apply_event(h_calm, 'sleep', events['sleep']);
+    expect(h_stressed.anxiety).toBeGreaterThan(h_calm.anxiety);
+  });
+
+  it('test_ssri_person_wakes_with_higher_prolactin', () => {
+    const h_ssri = create_human(50, 70, 0);
+    const h_normal = create_human(50, 0, 0);
+    h_ssri.energy = 40;
+    h_ssri.sleepiness = 60;
+    h_normal.energy = 40;
+    h_normal.sleepiness = 60;
+    apply_event(h_ssri, 'sleep', events['sleep']);
+    apply_event(h_normal, 'sleep', events['sleep']);
+    expect(h_ssri.prolactin).toBeGreaterThan(h_normal.prolactin);
+  });
+
+  it('test_testosterone_ongoing_vasopressin', () => {
+    const h_high = create_human(90);
+    const h_low = create_human(10);
+    h_high.vasopressin = 40.0;
+    h_low.vasopressin = 40.0;
+    decay_only(h_high, 3.0);
+    decay_only(h_low, 3.0);
+    expect(h_high.vasopressin).toBeGreaterThan(h_low.vasopressin);
+  });
+});
@@ -9,7 +9,7 @@ import { make_events, apply_event, apply_decay, drainNotifications } from './int
 let currentState   = null;
 let _human         = null;
 let _events        = null;
-let _lastActions   = [];
+const _lastActions = [];       // bounded to the last 20, mutated in place
 let allEvents      = {};        // { category: [{ name, description, duration, can_apply }] }
 let currentCategory = null;    // null = show category grid
 let _pinnedActions = [];        // action ids pinned via URL ?pinned= param
@@ -197,23 +197,45 @@ function human_to_dict(h) {
     };
 }
 
-function events_by_category() {
-    const cats = {};
+// name/description/duration never change, so the grouped entries are built once
+// per event catalog and events_by_category() only refreshes the state-dependent
+// fields in place. Renderers only read these entries.
+let _eventsSkeleton = null;    // { category: [entry] }
+let _eventEntries   = null;    // [[entry, event]] in catalog order
+let _availabilitySig = '';     // fingerprint of the dynamic fields after the last refresh
+
+function build_events_skeleton() {
+    _eventsSkeleton = {};
+    _eventEntries = [];
     for (const [name, event] of Object.entries(_events)) {
         const cat = event.category;
-        if (!cats[cat]) cats[cat] = [];
-        const reason = event.blocked_reason;
-        const noteFn = event.note;
-        cats[cat].push({
+        if (!_eventsSkeleton[cat]) _eventsSkeleton[cat] = [];
+        const entry = {
             name,
             description:    event.description,
             duration:       event.duration,
-            can_apply:      event.can_apply(_human),
-            blocked_reason: typeof reason === 'function' ? reason(_human) : (reason || ''),
-            note:           typeof noteFn === 'function' ? noteFn(_human) : null,
-        });
+            can_apply:      false,
+            blocked_reason: '',
+            note:           null,
+        };
+        _eventsSkeleton[cat].push(entry);
+        _eventEntries.push([entry, event]);
     }
-    return cats;
+}
+
+function events_by_category() {
+    if (!_eventsSkeleton) build_events_skeleton();
+    let sig = '';
+    for (const [entry, event] of _eventEntries) {
+        const reason = event.blocked_reason;
+        const noteFn = event.note;
+        entry.can_apply      = event.can_apply(_human);
+        entry.blocked_reason = typeof reason === 'function' ? reason(_human) : (reason || '');
+        entry.note           = typeof noteFn === 'function' ? noteFn(_human) : null;
+        sig += (entry.can_apply ? '1' : '0') + entry.blocked_reason + '\u0000' + (entry.note || '') + '\u0000';
+    }
+    _availabilitySig = sig;
+    return _eventsSkeleton;
 }
 
 function updateBackground(actionName) {
@@ -363,7 +385,9 @@ function applyAction(name) {
     const event = _events[name];
     if (!event || !event.can_apply(_human)) return;
 
-    const before = human_to_dict(_human);
+    // currentState is the snapshot of _human from the last applyStateToUI(), and
+    // _human only changes here or on reset, so reuse it instead of re-serializing
+    const before = currentState;
     apply_event(_human, name, event);
     const afterEvent = human_to_dict(_human);  // pre-decay snapshot for clean diff
     apply_decay(_human, event.duration);
@@ -377,9 +401,11 @@ function applyAction(name) {
         if (msg) showEventNotification(msg, 'action');
     }
 
+    // Bounded history: drop the oldest entry in place instead of re-slicing
     _lastActions.push(name);
-    if (_lastActions.length > 20) _lastActions = _lastActions.slice(-20);
+    if (_lastActions.length > 20) _lastActions.shift();
 
+    const prevSig = _availabilitySig;
     allEvents = events_by_category();
     const finalState = human_to_dict(_human);
     applyStateToUI(finalState, _lastActions.slice(-3));
@@ -388,6 +414,10 @@ function applyAction(name) {
 
     if (checkDeath(finalState)) return;
 
+    // The action area only shows can_apply/blocked_reason/note, so skip the
+    // innerHTML rebuild when none of them changed
+    if (_availabilitySig === prevSig) return;
+
     // Re-render current view with updated can_apply
     const q = $('search-input').value.trim();
     if (q) {
@@ -407,7 +437,7 @@ function resetGame() {
     const notifEl = $('event-notification');
     if (notifEl) notifEl.innerHTML = '';
     _human = create_human();
-    _lastActions = [];
+    _lastActions.length = 0;
     allEvents = events_by_category();
     currentCategory = null;
     applyStateToUI(human_to_dict(_human), []);
@@ -444,7 +474,7 @@ function init() {
 
     _human = create_human();
     _events = make_events();
-    _lastActions = [];
+    _lastActions.length = 0;
     allEvents = events_by_category();
     applyStateToUI(human_to_dict(_human), []);
     renderCategories();
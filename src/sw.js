@@ -1,4 +1,4 @@
-const CACHE = 'sensagotchi-v1';
+const CACHE = 'sensagotchi-v2';
 
 const PRECACHE = [
   '/',